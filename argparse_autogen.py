@@ -1,6 +1,39 @@
 import argparse
+import asyncio
+import collections
+import contextlib
+import importlib
 import inspect
+import io
+import json
+import mmap
+import os
 import re
+import shlex
+import sys
+import threading
+import time
+import types
+import typing
+import warnings
+
+try:
+    import tomllib
+except ImportError:  # pragma: no cover
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover
+    yaml = None
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
 
 
 def parse_docstring(docstring):
@@ -45,6 +78,103 @@ def parse_docstring(docstring):
     return '\n'.join(description), params
 
 
+class MappedFile(object):
+    """
+    Read-only memory-mapped file.
+    Annotate endpoint parameter with this type to receive mapped file instead of path.
+    Mapping is closed automatically after `EndpointParser.call` returns.
+    If buffers over the mapping are still alive at that moment (returned slices, generators),
+    the mapping is closed by garbage collector once the last of them is gone.
+    """
+
+    def __init__(self, name):
+        """
+        :param str name: Path to file
+        """
+        self.name = name
+        self.mmap = None
+        with open(name, 'rb') as f:
+            # Empty files can not be mapped
+            if os.fstat(f.fileno()).st_size:
+                self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def view(self):
+        """
+        Return zero-copy buffer over file contents.
+
+        :rtype: memoryview
+        """
+        return memoryview(self.mmap if self.mmap is not None else b'')
+
+    def close(self):
+        if self.mmap is not None:
+            try:
+                self.mmap.close()
+            except BufferError:
+                # Buffers exported from mapping are still alive, it is closed when they are collected
+                pass
+            self.mmap = None
+
+    def __len__(self):
+        return len(self.mmap) if self.mmap is not None else 0
+
+    def __getitem__(self, item):
+        if self.mmap is None:
+            return b''[item]
+        return self.mmap[item]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+MAPPED_TYPES = (mmap.mmap, memoryview, MappedFile)
+
+
+def _map_file(name, annotation, stack):
+    """
+    Map file `name` and return object suitable for `annotation`.
+
+    :param str name:
+    :param type annotation: One of `mmap.mmap`, `memoryview` or `MappedFile`
+    :param contextlib.ExitStack stack: Mapping is closed with this stack
+    """
+    mapped_file = stack.enter_context(MappedFile(name))
+    if annotation is MappedFile:
+        return mapped_file
+    if annotation is memoryview:
+        return mapped_file.view()
+    if mapped_file.mmap is None:
+        raise ValueError('Cannot map empty file: %s' % name)
+    return mapped_file.mmap
+
+
+def map_file_arguments(func, args, stack, call_plan=None):
+    """
+    Replace paths with memory-mapped files for `func` params annotated
+    with `mmap.mmap`, `memoryview` or `MappedFile`.
+
+    :param callable func:
+    :param dict args: Func arguments
+    :param contextlib.ExitStack stack: All mappings are closed with this stack
+    :param tuple|None call_plan: Result of `get_call_plan` for `func`
+    :return: Copy of `args` with mapped files
+    :rtype: dict
+    """
+    args = dict(args)
+    for param_name, kind, annotation in call_plan or get_call_plan(func):
+        if annotation not in MAPPED_TYPES or args.get(param_name) is None:
+            continue
+        value = args[param_name]
+        if isinstance(value, (list, tuple)):
+            args[param_name] = [_map_file(name, annotation, stack) for name in value]
+        else:
+            args[param_name] = _map_file(value, annotation, stack)
+    return args
+
+
 def _get_cls_paths(cls, path=None):
     """
     :param type|object cls:
@@ -92,12 +222,16 @@ def autospec(parser, func, argument_overrides=None):
     :param argparse.ArgumentParser parser: Target parser
     :param func: Function to get signature from
     :param None|dict[str, dict] argument_overrides: passed to add_argument for param
+    :return: Added actions
+    :rtype: list[argparse.Action]
     """
+    actions = []
     docstring = inspect.getdoc(func) or ""
     parser.description, params_docs = parse_docstring(docstring)
     argument_overrides = argument_overrides or dict()
 
     signature = inspect.signature(func)
+    type_hints = _get_type_hints(func)
     for param_name, param in signature.parameters.items():
         if param_name == 'self' or param_name == 'cls':
             # https://bitbucket.org/ned/coveragepy/issues/198/continue-marked-as-not-covered
@@ -112,6 +246,9 @@ def autospec(parser, func, argument_overrides=None):
             if param_doc['name'] == param_name:
                 kwargs['help'] = param_doc['description']
 
+        if type_hints.get(param_name, param.annotation) in MAPPED_TYPES:
+            kwargs['metavar'] = 'FILE'
+
         if param.kind == inspect.Parameter.VAR_POSITIONAL:
             kwargs['nargs'] = '+'
         elif param.kind == inspect.Parameter.VAR_KEYWORD:
@@ -132,15 +269,95 @@ def autospec(parser, func, argument_overrides=None):
         if param_name in argument_overrides:
             kwargs.update(argument_overrides[param_name])
 
-        parser.add_argument(param_name, **kwargs)
+        actions.append(parser.add_argument(param_name, **kwargs))
+
+    return actions
+
+
+def _remove_actions(parser, actions):
+    """
+    Remove actions, previously added to parser.
+
+    :param argparse.ArgumentParser parser:
+    :param list[argparse.Action] actions:
+    """
+    for action in actions:
+        for group in parser._action_groups:
+            if action in group._group_actions:
+                group._remove_action(action)
+                break
+        for option_string in action.option_strings:
+            parser._option_string_actions.pop(option_string, None)
+
+
+def _get_qualname_attr(obj, qualname):
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+    return obj
 
 
-def get_func_arguments(func, argparse_args):
+def _resolve_reloaded(func, module):
+    """
+    Find `func` in reloaded `module`. Instances of bound methods are switched to reloaded class.
+
+    :param callable func:
+    :param module: Reloaded module
+    :return: Reloaded func or None if it can not be found
+    """
+    owner = getattr(func, '__self__', None)
+    try:
+        if owner is None or inspect.ismodule(owner):
+            reloaded = _get_qualname_attr(module, func.__qualname__)
+        elif inspect.isclass(owner):
+            reloaded = getattr(_get_qualname_attr(module, owner.__qualname__), func.__name__)
+        else:
+            cls = _get_qualname_attr(module, type(owner).__qualname__)
+            if cls is type(owner):
+                return None
+            owner.__class__ = cls
+            reloaded = getattr(owner, func.__name__)
+    except (AttributeError, TypeError):
+        return None
+    # Reload keeps names removed from source in module namespace, they are not reloaded
+    if getattr(reloaded, '__func__', reloaded) is getattr(func, '__func__', func):
+        return None
+    return reloaded
+
+
+def _get_type_hints(func):
+    """
+    Return resolved annotations of func, so string annotations (`from __future__ import annotations`) work too.
+
+    :rtype: dict
+    """
+    try:
+        return typing.get_type_hints(func)
+    except Exception:
+        # Unresolvable forward references, objects without annotations support
+        return dict()
+
+
+def get_call_plan(func):
+    """
+    Return signature of func in a form that is cheap to iterate on every call.
+
+    :param callable func:
+    :return: tuple of param name, kind and annotation for every param
+    :rtype: tuple[tuple[str, int, object]]
+    """
+    signature = inspect.signature(func)
+    type_hints = _get_type_hints(func)
+    return tuple((param_name, param.kind, type_hints.get(param_name, param.annotation))
+                 for param_name, param in signature.parameters.items())
+
+
+def get_func_arguments(func, argparse_args, call_plan=None):
     """
     Return args and kwargs for func.
 
     :param callable func:
     :param argparse.Namespace|dict argparse_args: argparse Namespace or dict
+    :param tuple|None call_plan: Result of `get_call_plan` for `func`
     :return: args and kwargs to be passed into func
     :rtype: tuple[list, dict]
     """
@@ -149,13 +366,15 @@ def get_func_arguments(func, argparse_args):
 
     args = list()
     kwargs = dict()
-    signature = inspect.signature(func)
     got_positional = False
-    for param_name, param in signature.parameters.items():
+    for param_name, kind, annotation in call_plan or get_call_plan(func):
         if param_name not in argparse_args:
             continue
-        if param.kind == inspect.Parameter.VAR_KEYWORD:
+        if kind == inspect.Parameter.VAR_KEYWORD:
             kwargs_list = argparse_args[param_name]
+            if isinstance(kwargs_list, dict):
+                kwargs.update(kwargs_list)
+                continue
             kw = dict()
             for item in kwargs_list:
                 key, value = item.split('=')
@@ -165,7 +384,7 @@ def get_func_arguments(func, argparse_args):
         elif got_positional:
             kwargs[param_name] = argparse_args[param_name]
             continue
-        got_positional = param.kind == inspect.Parameter.VAR_POSITIONAL
+        got_positional = kind == inspect.Parameter.VAR_POSITIONAL
         if got_positional:
             args.extend(argparse_args[param_name])
         else:
@@ -198,9 +417,415 @@ def parse_path(path):
     return path
 
 
+class _ThreadLocalStream(object):
+    """
+    Stream proxy that passes access to stream set for current thread, or to original stream.
+    """
+
+    def __init__(self, original):
+        self.original = original
+        self.local = threading.local()
+
+    def get_stream(self):
+        stream = getattr(self.local, 'stream', None)
+        return self.original if stream is None else stream
+
+    def __getattr__(self, item):
+        return getattr(self.get_stream(), item)
+
+    def __iter__(self):
+        return iter(self.get_stream())
+
+
+_redirect_lock = threading.Lock()
+_redirect_count = 0
+_redirect_proxies = None
+
+
+def _get_thread_streams():
+    """
+    Return stdin, stdout and stderr redirected for current thread, None if they are not redirected.
+
+    :rtype: tuple|None
+    """
+    proxies = _redirect_proxies
+    if proxies is None:
+        return None
+    return tuple(getattr(proxy.local, 'stream', None) for proxy in proxies)
+
+
+@contextlib.contextmanager
+def _redirect_streams(stdin, stdout, stderr):
+    """
+    Redirect stdin, stdout and stderr for current thread only.
+    Process streams are replaced with proxies while at least one thread has them redirected.
+    """
+    global _redirect_count, _redirect_proxies
+    with _redirect_lock:
+        if _redirect_count == 0:
+            _redirect_proxies = tuple(map(_ThreadLocalStream, (sys.stdin, sys.stdout, sys.stderr)))
+            sys.stdin, sys.stdout, sys.stderr = _redirect_proxies
+        _redirect_count += 1
+        proxies = _redirect_proxies
+
+    previous = [getattr(proxy.local, 'stream', None) for proxy in proxies]
+    for proxy, stream in zip(proxies, (stdin, stdout, stderr)):
+        proxy.local.stream = stream
+    try:
+        yield
+    finally:
+        for proxy, stream in zip(proxies, previous):
+            proxy.local.stream = stream
+        with _redirect_lock:
+            _redirect_count -= 1
+            if _redirect_count == 0:
+                sys.stdin, sys.stdout, sys.stderr = (proxy.original for proxy in proxies)
+                _redirect_proxies = None
+
+
+class InvokeResult(object):
+    """
+    Result of `EndpointParser.invoke` call.
+    """
+
+    def __init__(self, exit_code=0, stdout='', stderr='', return_value=None, exception=None):
+        """
+        :param int exit_code: Exit code. 0 if call succeeded
+        :param str stdout: Captured stdout
+        :param str stderr: Captured stderr
+        :param return_value: Value returned by endpoint func
+        :param Exception|None exception: Exception raised by endpoint func
+
+        `stats` field holds `CallStats` of every called endpoint, one per pipeline stage.
+        """
+        self.exit_code = exit_code
+        self.stdout = stdout
+        self.stderr = stderr
+        self.return_value = return_value
+        self.exception = exception
+        self.stats = []
+
+    def __repr__(self):
+        return '<InvokeResult exit_code=%r return_value=%r exception=%r>' % (
+            self.exit_code, self.return_value, self.exception)
+
+
+_config_cache = dict()
+
+
+def _compile_config(config, path=()):
+    """
+    Flatten nested config into dict of endpoint paths to dicts of argument defaults.
+    Keys can be dotted paths, e.g. `{'users.get': {'verbose': True}}`.
+
+    :param dict config:
+    :param tuple path:
+    :rtype: dict[tuple, dict]
+    """
+    compiled = dict()
+    for key, value in config.items():
+        key_path = path + tuple(parse_path(str(key)))
+        if isinstance(value, dict):
+            for endpoint_path, defaults in _compile_config(value, key_path).items():
+                compiled.setdefault(endpoint_path, dict()).update(defaults)
+        else:
+            compiled.setdefault(key_path[:-1], dict())[key_path[-1]] = value
+    return compiled
+
+
+def load_config(filename):
+    """
+    Load and compile JSON, TOML or YAML config file. Compiled config is cached until file is modified.
+
+    :param str filename:
+    :return: Result of `_compile_config`. Empty dict if file does not exist.
+    :rtype: dict[tuple, dict]
+    """
+    try:
+        mtime = os.stat(filename).st_mtime_ns
+    except OSError:
+        return dict()
+
+    cached = _config_cache.get(filename)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    extension = os.path.splitext(filename)[1].lower()
+    with open(filename, 'rb') as f:
+        if extension == '.json':
+            config = json.loads(f.read().decode())
+        elif extension == '.toml':
+            if tomllib is None:
+                raise ImportError('tomli is required to load %s' % filename)
+            config = tomllib.loads(f.read().decode())
+        elif extension in ('.yaml', '.yml'):
+            if yaml is None:
+                raise ImportError('PyYAML is required to load %s' % filename)
+            config = yaml.safe_load(f) or dict()
+        else:
+            raise ValueError('Unsupported config file format: %s' % filename)
+
+    compiled = _compile_config(config)
+    _config_cache[filename] = (mtime, compiled)
+    return compiled
+
+
+def _levenshtein(a, b):
+    """
+    Edit distance between two strings.
+
+    :param str a:
+    :param str b:
+    :rtype: int
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def _get_deletes(word, max_distance):
+    """
+    Return all strings produced by deleting up to `max_distance` characters from `word`.
+
+    :rtype: set[str]
+    """
+    deletes = {word}
+    current = {word}
+    for _ in range(max_distance):
+        current = {item[:i] + item[i + 1:] for item in current for i in range(len(item))}
+        deletes |= current
+    return deletes
+
+
+class _DeletesIndex(object):
+    """
+    Index of strings by their variants with deleted characters.
+    Strings within edit distance `n` share a variant with at most `n` deletions,
+    so lookup costs a few dict hits regardless of index size.
+    """
+
+    def __init__(self, max_distance=2):
+        self.max_distance = max_distance
+        self.variants = dict()
+
+    def add(self, word):
+        for variant in _get_deletes(word, self.max_distance):
+            self.variants.setdefault(variant, set()).add(word)
+
+    def search(self, word, max_distance):
+        """
+        :rtype: list[tuple[int, str]]
+        """
+        max_distance = min(max_distance, self.max_distance)
+        candidates = set()
+        for variant in _get_deletes(word, max_distance):
+            candidates.update(self.variants.get(variant, ()))
+
+        found = []
+        for candidate in candidates:
+            if abs(len(candidate) - len(word)) <= max_distance:
+                distance = _levenshtein(word, candidate)
+                if distance <= max_distance:
+                    found.append((distance, candidate))
+        return found
+
+
+def _build_suggestion_index(paths):
+    """
+    Build index of path items grouped by depth.
+
+    :param list[tuple] paths: Full endpoint paths
+    :return: dict of depth to index of path items and prefixes ending with each item,
+        and dict of prefixes to full paths under them
+    :rtype: tuple[dict[int, tuple[_DeletesIndex, dict[str, list[tuple]]]], dict[tuple, list[tuple]]]
+    """
+    index = dict()
+    prefixes = dict()
+    for path in sorted(paths):
+        for depth in range(1, len(path) + 1):
+            prefix = path[:depth]
+            if prefix not in prefixes:
+                items_index, items = index.setdefault(depth, (_DeletesIndex(), dict()))
+                if prefix[-1] not in items:
+                    items_index.add(prefix[-1])
+                    items[prefix[-1]] = []
+                items[prefix[-1]].append(prefix)
+                prefixes[prefix] = []
+            prefixes[prefix].append(path)
+    return index, prefixes
+
+
+class EndpointTimeout(TimeoutError):
+    """
+    Endpoint func did not return in time.
+    """
+
+
+CallStats = collections.namedtuple('CallStats', 'endpoint wall_time cpu_time max_rss_delta timed_out abandoned_threads')
+CallStats.__doc__ = """
+Resources used by endpoint call.
+`cpu_time` is CPU time of the thread that ran the func, None if it timed out.
+Python before 3.7 has no per-thread CPU clock, CPU time of the whole process is used there.
+`max_rss_delta` is growth of process peak RSS in bytes, None if not available on current platform.
+`abandoned_threads` is number of threads of timed out calls that are still running in the process.
+"""
+
+_abandoned_threads = 0
+_abandoned_threads_lock = threading.Lock()
+
+
+def get_abandoned_threads():
+    """
+    Return number of threads of timed out endpoint calls that are still running.
+
+    :rtype: int
+    """
+    return _abandoned_threads
+
+
+def _get_max_rss():
+    """
+    Return peak RSS of current process in bytes.
+
+    :rtype: int|None
+    """
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def _run_in_thread(func, timeout, stack=None):
+    """
+    Run func in daemon thread and wait for its result at most `timeout` seconds, or until it is done if None.
+    Thread can not be killed, so on timeout it is left running in background.
+
+    :param contextlib.ExitStack|None stack: Resources used by func. On timeout their closing is passed to the thread.
+    :raises EndpointTimeout:
+    """
+    global _abandoned_threads
+    outcome = dict()
+    lock = threading.Lock()
+    streams = _get_thread_streams()
+
+    def target():
+        global _abandoned_threads
+        if streams is not None:
+            # Inherit streams redirected by `EndpointParser.invoke`
+            for proxy, stream in zip(_redirect_proxies or (), streams):
+                proxy.local.stream = stream
+        try:
+            outcome['result'] = func()
+        except BaseException as e:
+            outcome['error'] = e
+        with lock:
+            outcome['done'] = True
+            abandoned = outcome.get('abandoned')
+        if abandoned:
+            with _abandoned_threads_lock:
+                _abandoned_threads -= 1
+            if outcome['abandoned_stack'] is not None:
+                outcome['abandoned_stack'].close()
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    with lock:
+        if not outcome.get('done'):
+            with _abandoned_threads_lock:
+                _abandoned_threads += 1
+            outcome['abandoned'] = True
+            outcome['abandoned_stack'] = stack.pop_all() if stack is not None else None
+            raise EndpointTimeout('Endpoint call timed out after %s seconds' % timeout)
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+
+def _run_coroutine(coroutine, timeout=None):
+    """
+    Run coroutine in new event loop, cancelling it after `timeout` seconds.
+
+    :param float|None timeout:
+    :raises EndpointTimeout:
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        if timeout is None:
+            return loop.run_until_complete(coroutine)
+        return loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+    except asyncio.TimeoutError:
+        raise EndpointTimeout('Endpoint call timed out after %s seconds' % timeout)
+    finally:
+        loop.close()
+
+
+def _is_loop_running():
+    """
+    Return True if event loop is running in current thread, so another one can not be run here.
+
+    :rtype: bool
+    """
+    # asyncio.get_running_loop is not available before python 3.7
+    return asyncio.events._get_running_loop() is not None
+
+
+def _get_call_path_arg(args):
+    """
+    Return endpoint path from positional args of `call_path`.
+    """
+    if len(args) != 1:
+        raise TypeError('call_path() takes exactly one positional argument: path (%s given)' % len(args))
+    return args[0]
+
+
+class ReloadError(Exception):
+    """
+    Raised by `EndpointParser.reload_endpoints` when reload was not complete.
+    """
+
+    def __init__(self, paths, errors, unresolved):
+        """
+        :param list[tuple] paths: Paths of endpoints that were reloaded
+        :param dict[str, Exception] errors: Exceptions raised by modules that failed to reload
+        :param list[tuple] unresolved: Paths of endpoints whose funcs were not found in reloaded modules.
+            They keep calling old funcs.
+        """
+        self.paths = paths
+        self.errors = errors
+        self.unresolved = unresolved
+        messages = ['%s: %r' % item for item in sorted(errors.items())]
+        if unresolved:
+            messages.append('not found: %s' % ', '.join(' '.join(path) for path in unresolved))
+        super(ReloadError, self).__init__('Failed to reload endpoints (%s)' % '; '.join(messages))
+
+
+Endpoint = collections.namedtuple('Endpoint', 'path func parser autospec argument_overrides actions')
+
+
 class EndpointParser(argparse.ArgumentParser):
     subparsers = None
-    internal_keys = {'__func__', '__endpoint__'}
+    root = None
+    path = None
+    endpoints = None
+    sources = None
+    suggestions_limit = 3
+    _suggestion_index = None
+    _call_plans = None
+    _frozen = False
+    config_files = ()
+    env_prefix = None
+    internal_keys = {'__func__', '__endpoint__', '__pipe__', '__timeout__'}
+    pipeline_separator = None
+    call_timeout = None
+    metrics_callback = None
 
     def clear_internal_keys(self, args):
         """
@@ -221,7 +846,10 @@ class EndpointParser(argparse.ArgumentParser):
 
         :rtype: argparse._SubParsersAction
         """
+        self._check_frozen()
+        kwargs.setdefault('action', _EndpointSubParsersAction)
         self.subparsers = super(EndpointParser, self).add_subparsers(**kwargs)
+        self.subparsers.container = self
         return self.subparsers
 
     # noinspection PyProtectedMember
@@ -238,8 +866,10 @@ class EndpointParser(argparse.ArgumentParser):
             return self
 
         parser = self
+        full_path = list(self.path or [])
 
         for key in path:
+            full_path.append(key)
             if parser.subparsers is None:
                 parser.add_subparsers(title='Available commands')
             if key in parser.subparsers._name_parser_map:
@@ -247,28 +877,264 @@ class EndpointParser(argparse.ArgumentParser):
             else:
                 parser = parser.subparsers.add_parser(key, **kwargs)
 
-        parser.path = path
+        parser.path = full_path
 
         return parser
 
-    def add_endpoint(self, path, func=None, autospec=True, argument_overrides=None, **kwargs):
+    def add_endpoint(self, path, func=None, autospec=True, argument_overrides=None, pipe_argument=None, timeout=None,
+                     **kwargs):
+        """
+        Add endpoint for `path` that calls `func`.
+
+        :param str|list|tuple|callable path: If callable, it is used as `func` and path is generated from its qualname
+        :param callable func:
+        :param bool autospec: Generate arguments from `func` signature
+        :param None|dict[str, dict] argument_overrides: passed to add_argument for param
+        :param str|None pipe_argument: Param that receives result of previous stage of pipeline.
+            It becomes optional on command line.
+        :param float|None timeout: Max seconds to wait for `func`. Overrides `call_timeout` of root parser.
+        :rtype: EndpointParser
+        """
         if func is None and callable(path):
             func = path
             qualname = clear_qualname(func.__qualname__)
             path = qualname[1 if len(qualname) > 1 else 0:]
 
+        if func and pipe_argument:
+            param = inspect.signature(func).parameters[pipe_argument]
+            if param.kind == inspect.Parameter.VAR_POSITIONAL:
+                pipe_overrides = dict(nargs='*')
+            elif param.default is inspect._empty:
+                pipe_overrides = dict(nargs='?', default=None)
+            else:
+                pipe_overrides = dict()
+            if pipe_overrides:
+                argument_overrides = dict(argument_overrides or {})
+                argument_overrides[pipe_argument] = dict(pipe_overrides, **argument_overrides.get(pipe_argument, {}))
+
         kwargs.setdefault('help', parse_docstring(inspect.getdoc(func) or "")[0])
         parser = self.get_endpoint_parser(path, **kwargs)
 
         if func:
+            actions = []
             if autospec:
-                globals()['autospec'](parser, func, argument_overrides=argument_overrides)
+                actions = globals()['autospec'](parser, func, argument_overrides=argument_overrides)
             parser.set_defaults(__func__=func)
+            self._register_endpoint(Endpoint(tuple(parser.path or []), func, parser, autospec,
+                                             argument_overrides, actions))
 
         parser.set_defaults(__endpoint__=path)
+        if pipe_argument:
+            parser.set_defaults(__pipe__=pipe_argument)
+        if timeout is not None:
+            parser.set_defaults(__timeout__=timeout)
 
         return parser
 
+    def _register_endpoint(self, endpoint):
+        """
+        Store endpoint and modification time of its source module at the root parser.
+
+        :param Endpoint endpoint:
+        """
+        root = self.root or self
+        if root.endpoints is None:
+            root.endpoints = dict()
+            root.sources = dict()
+        root.endpoints[endpoint.path] = endpoint
+        root._suggestion_index = None
+
+        module = inspect.getmodule(endpoint.func)
+        filename = getattr(module, '__file__', None)
+        if not filename or module.__name__ == '__main__' or module.__name__ in root.sources:
+            return
+        try:
+            root.sources[module.__name__] = (filename, os.stat(filename).st_mtime_ns)
+        except OSError:
+            pass
+
+    def configure_defaults(self, config_files=None, env_prefix=None):
+        """
+        Set sources of arguments defaults for all endpoints.
+        Precedence is: command line, environment, config files, signature default.
+        Sources are read only for the dispatched endpoint.
+
+        :param str|list[str]|None config_files: JSON, TOML or YAML files. Later files override earlier ones.
+            Keys are endpoint paths and argument names, e.g. `{"users": {"get": {"verbose": true}}}`
+        :param str|None env_prefix: Prefix of environment variables, e.g. `MYCLI` for `MYCLI_USERS_GET_VERBOSE`
+        """
+        self._check_frozen()
+        root = self.root or self
+        if isinstance(config_files, str):
+            config_files = [config_files]
+        root.config_files = tuple(os.path.expanduser(filename) for filename in config_files or ())
+        root.env_prefix = env_prefix.rstrip('_') if env_prefix else None
+
+    def get_configured_defaults(self):
+        """
+        Return arguments defaults of this parser from environment and config files.
+
+        :rtype: dict
+        """
+        root = self.root or self
+        path = tuple(self.path or [])
+        defaults = dict()
+        for filename in root.config_files:
+            defaults.update(load_config(filename).get(path, {}))
+
+        if root.env_prefix:
+            for action in self._actions:
+                name = '_'.join((root.env_prefix,) + path + (action.dest,))
+                name = re.sub('[^A-Za-z0-9_]', '_', name).upper()
+                if name in os.environ:
+                    defaults[action.dest] = os.environ[name]
+        return defaults
+
+    def _convert_configured_default(self, action, value):
+        """
+        Convert value from config file or environment as argparse converts command line values.
+        Environment strings of options with many values are split as in shell.
+        """
+        if action.nargs == 0:
+            if isinstance(value, str):
+                # store_true and store_false actions
+                value = value.lower() in ('1', 'true', 'yes', 'on')
+            return value
+        if action.nargs in ('*', '+') or isinstance(action.nargs, int):
+            if isinstance(value, str):
+                value = shlex.split(value)
+            elif not isinstance(value, (list, tuple)):
+                value = [value]
+            if not value and action.nargs == '+':
+                raise argparse.ArgumentError(action, 'expected at least one argument')
+            return [self._convert_value(self, action, item) for item in value]
+        return self._convert_value(self, action, value)
+
+    def parse_known_args(self, args=None, namespace=None):
+        """
+        Put configured defaults into namespace before parsing.
+        argparse keeps them unless argument is given in command line.
+        """
+        root = self.root or self
+        defaults = self.get_configured_defaults() if root.config_files or root.env_prefix else None
+        if defaults:
+            if namespace is None:
+                namespace = argparse.Namespace()
+            for action in self._actions:
+                if action.option_strings and action.dest in defaults and not hasattr(namespace, action.dest):
+                    try:
+                        setattr(namespace, action.dest, self._convert_configured_default(action, defaults[action.dest]))
+                    except argparse.ArgumentError as e:
+                        self.error(str(e))
+        return super(EndpointParser, self).parse_known_args(args, namespace)
+
+    def suggest_endpoints(self, path, limit=None):
+        """
+        Return registered endpoint paths closest to mistyped `path`.
+        Only the last item of `path` is considered mistyped.
+
+        :param str|list|tuple path: Full path
+        :param int|None limit: Max number of suggestions. `suggestions_limit` by default
+        :rtype: list[tuple]
+        """
+        root = self.root or self
+        path = parse_path(path)
+        if not path or not root.endpoints:
+            return []
+        if root._suggestion_index is None:
+            root._suggestion_index = _build_suggestion_index(root.endpoints)
+        index, prefixes = root._suggestion_index
+        if len(path) not in index:
+            return []
+
+        items_index, items = index[len(path)]
+        limit = limit or self.suggestions_limit
+        parent = tuple(path[:-1])
+        found = collections.defaultdict(list)
+        for distance, item in items_index.search(path[-1], min(2, len(path[-1]) // 3 + 1)):
+            found[distance].append(item)
+
+        suggestions = []
+        for distance in sorted(found):
+            # Prefer prefixes under the same parent
+            same_parent = [parent + (item,) for item in sorted(found[distance])]
+            other_parents = sorted(prefix for item in found[distance] for prefix in items[item]
+                                   if prefix[:-1] != parent)
+            for prefix in same_parent + other_parents:
+                suggestions.extend(prefixes.get(prefix, ()))
+                if len(suggestions) >= limit:
+                    return suggestions[:limit]
+        return suggestions
+
+    # noinspection PyProtectedMember
+    def _check_value(self, action, value):
+        """
+        Add suggestions of closest endpoints to invalid command error.
+        """
+        try:
+            super(EndpointParser, self)._check_value(action, value)
+        except argparse.ArgumentError as e:
+            suggestions = self.suggest_endpoints(list(self.path or []) + [value]) if action is self.subparsers else None
+            if not suggestions:
+                raise
+            raise argparse.ArgumentError(action, '%s\nDid you mean: %s?' % (
+                e.message, ', '.join(' '.join(path) for path in suggestions)))
+
+    def reload_endpoints(self):
+        """
+        Reload modules of registered endpoints that were changed since they were loaded,
+        and autospec parsers of affected endpoints again. Each source file is checked once.
+
+        :return: Paths of reloaded endpoints
+        :rtype: list[tuple]
+        :raises ReloadError: If some modules failed to reload or some endpoints are not found in reloaded modules.
+            Endpoints of other changed modules are reloaded anyway. Failed modules are retried on next call.
+        """
+        self._check_frozen()
+        root = self.root or self
+        if not root.endpoints:
+            return []
+
+        reloaded = dict()
+        errors = dict()
+        for module_name, (filename, mtime) in list(root.sources.items()):
+            try:
+                current_mtime = os.stat(filename).st_mtime_ns
+            except OSError:
+                continue
+            if current_mtime == mtime or module_name not in sys.modules:
+                continue
+            try:
+                reloaded[module_name] = importlib.reload(sys.modules[module_name])
+            except Exception as e:
+                errors[module_name] = e
+                continue
+            root.sources[module_name] = (filename, current_mtime)
+
+        paths = []
+        unresolved = []
+        for path, endpoint in list(root.endpoints.items()):
+            module = inspect.getmodule(endpoint.func)
+            module_name = module.__name__ if module else None
+            if module_name not in reloaded:
+                continue
+            func = _resolve_reloaded(endpoint.func, reloaded[module_name])
+            if func is None:
+                unresolved.append(path)
+                continue
+            (root._call_plans or {}).pop(id(endpoint.func), None)
+            _remove_actions(endpoint.parser, endpoint.actions)
+            actions = []
+            if endpoint.autospec:
+                actions = autospec(endpoint.parser, func, argument_overrides=endpoint.argument_overrides)
+            endpoint.parser.set_defaults(__func__=func)
+            root.endpoints[path] = endpoint._replace(func=func, actions=actions)
+            paths.append(path)
+
+        if errors or unresolved:
+            raise ReloadError(paths, errors, unresolved)
+        return paths
+
     def generate_endpoints(self, obj, root_path=None, endpoint_kwargs=None, **kwargs):
         """
         Generate endpoints from object or list of objects.
@@ -290,18 +1156,433 @@ class EndpointParser(argparse.ArgumentParser):
             kw.update(endpoint_kwargs.get(path, {}) or endpoint_kwargs.get('.'.join(path), {}))
             self.add_endpoint(path, func=func, **kw)
 
-    def parse_and_call(self, *args, **kwargs):
+    def parse_and_call(self, args=None, namespace=None):
         """
         Shortcut function to parse args and call.
+        If `pipeline_separator` is set, args can contain several stages separated by it.
+        Result of each stage is passed into `pipe_argument` of the next stage endpoint.
+        Args after `--` are never split.
+        """
+        return self._call_pipeline(args, namespace, self.call)
+
+    def _call_pipeline(self, args, namespace, call, settings=None):
+        """
+        :param list|tuple|None args:
+        :param argparse.Namespace|None namespace: Used for the first stage only
+        :param callable call: Calls parsed namespace
+        :param settings: Object with `pipeline_separator` field. This parser by default
+        """
+        if args is None:
+            args = sys.argv[1:]
+
+        stages = [[]]
+        separator = (settings or self).pipeline_separator
+        for arg in args:
+            if arg == '--':
+                separator = None
+            if separator is not None and arg == separator:
+                stages.append([])
+            else:
+                stages[-1].append(arg)
+
+        result = None
+        for i, stage in enumerate(stages):
+            parsed = self.parse_args(stage, namespace if i == 0 else None)
+            if i:
+                pipe_argument = getattr(parsed, '__pipe__', None)
+                if pipe_argument is None:
+                    self.error('Endpoint does not accept piped input: %s' % ' '.join(stage))
+                setattr(parsed, pipe_argument, result)
+            result = call(parsed)
+        return result
+
+    def call_path(self, *args, **kwargs):
+        """
+        Call endpoint at path with already typed arguments, bypassing command line parsing.
+        Arguments are validated against endpoint parser arguments, and missing ones are set to defaults.
+        Path is the only positional argument, so endpoint params can have any name, including `path`.
+
+        Example: `parser.call_path('users get', user_id=5)`
+        """
+        return self._call_path(_get_call_path_arg(args), kwargs)
+
+    def call_mapping(self, path, mapping):
+        """
+        Same as `call_path`, but arguments are passed as dict or JSON object string.
+
+        :param str|list|tuple path: Endpoint path
+        :param dict|str|bytes mapping:
+        """
+        if isinstance(mapping, (str, bytes)):
+            mapping = json.loads(mapping if isinstance(mapping, str) else mapping.decode())
+        return self._call_path(path, mapping)
+
+    # noinspection PyProtectedMember
+    def _call_path(self, path, values, call_plans=None, settings=None):
+        """
+        :param str|list|tuple path: Endpoint path
+        :param dict values: Arguments
+        :param dict|None call_plans: Call plans of endpoint funcs by their ids
+        :param settings: Object with `call_timeout` and `metrics_callback` fields. Root parser by default
         """
-        args = self.parse_args(*args, **kwargs)
-        return self.call(args)
+        root = self.root or self
+        path = tuple(list(self.path or []) + list(parse_path(path)))
+        endpoint = (root.endpoints or {}).get(path)
+        if endpoint is None:
+            self.error('Invalid endpoint: %s' % ' '.join(path))
+
+        call_plan = (call_plans or {}).get(id(endpoint.func)) or self._get_call_plan(endpoint.func)
+        var_keyword = None
+        for param_name, kind, annotation in call_plan:
+            if kind == inspect.Parameter.VAR_KEYWORD:
+                var_keyword = param_name
+
+        parser = endpoint.parser
+        values = dict(values)
+        args = dict()
+        missing = []
+        configured_defaults = parser.get_configured_defaults() if root.config_files or root.env_prefix else {}
+        try:
+            for action in parser._actions:
+                if action.dest in (argparse.SUPPRESS, var_keyword) or action is parser.subparsers:
+                    continue
+                if action.dest in values:
+                    value = values.pop(action.dest)
+                    if action.nargs == 0:
+                        # store_true and store_false actions
+                        value = parser._convert_configured_default(action, value)
+                    elif isinstance(value, (list, tuple)) or action.nargs in ('+', '*'):
+                        if not isinstance(value, (list, tuple)):
+                            value = [value]
+                        if not value and action.nargs == '+':
+                            missing.append(argparse._get_action_name(action))
+                            continue
+                        value = [self._convert_value(parser, action, item) for item in value]
+                    else:
+                        value = self._convert_value(parser, action, value)
+                elif action.required:
+                    missing.append(argparse._get_action_name(action))
+                    continue
+                elif action.option_strings and action.dest in configured_defaults:
+                    value = parser._convert_configured_default(action, configured_defaults[action.dest])
+                elif isinstance(action.default, str):
+                    value = parser._get_value(action, action.default)
+                else:
+                    value = action.default
+                args[action.dest] = value
+        except argparse.ArgumentError as e:
+            parser.error(str(e))
+
+        if missing:
+            parser.error('the following arguments are required: %s' % ', '.join(missing))
+        if var_keyword:
+            args[var_keyword] = values
+        elif values:
+            parser.error('unrecognized arguments: %s' % ', '.join(sorted(values)))
+
+        return self._call_func(endpoint.func, args, call_plan=call_plan, endpoint=path,
+                               timeout=parser._defaults.get('__timeout__'), settings=settings)
+
+    # noinspection PyProtectedMember
+    @staticmethod
+    def _convert_value(parser, action, value):
+        """
+        Convert string value with argument type and check its choices, as argparse does.
+        """
+        if isinstance(value, str):
+            value = parser._get_value(action, value)
+        parser._check_value(action, value)
+        return value
+
+    def invoke(self, argv, stdin=None):
+        """
+        Parse `argv` and call endpoint in-process.
+        stdout and stderr are captured, SystemExit is never raised.
+        Streams are redirected for current thread only, so concurrent invocations do not mix their output.
+
+        :param list|tuple argv:
+        :param str|io.TextIOBase|None stdin: Data or stream used as stdin during call
+        :rtype: InvokeResult
+        """
+        if stdin is None or isinstance(stdin, str):
+            stdin = io.StringIO(stdin or '')
+        stdout, stderr = io.StringIO(), io.StringIO()
+        result = InvokeResult()
+
+        try:
+            with _redirect_streams(stdin, stdout, stderr):
+                result.return_value = self._call_pipeline(list(argv), None,
+                                                          lambda args: self._call(args, stats=result.stats))
+        except SystemExit as e:
+            result.exit_code = e.code
+            if result.exit_code is None:
+                result.exit_code = 0
+            elif not isinstance(result.exit_code, int):
+                stderr.write('%s\n' % result.exit_code)
+                result.exit_code = 1
+        except Exception as e:
+            result.exception = e
+            result.exit_code = 1
+
+        result.stdout = stdout.getvalue()
+        result.stderr = stderr.getvalue()
+        return result
 
     def call(self, args):
-        if not hasattr(args, '__func__'):
+        """
+        Call endpoint func with parsed args. Coroutine functions are run to completion in new event loop.
+        If timeout is set for endpoint or `call_timeout` for root parser, `EndpointTimeout` is raised
+        when func does not return in time. Resources used by call are passed to `metrics_callback` of root parser.
+
+        :param argparse.Namespace args:
+        """
+        return self._call(args)
+
+    def _call(self, args, stats=None, call_plans=None, settings=None):
+        """
+        :param argparse.Namespace|dict args: Parsed arguments. Internal keys are deleted.
+        :param list|None stats: `CallStats` of call is appended to it
+        :param dict|None call_plans: Call plans of endpoint funcs by their ids
+        :param settings: Object with `call_timeout` and `metrics_callback` fields. Root parser by default
+        """
+        if isinstance(args, argparse.Namespace):
+            args = vars(args)
+        if '__func__' not in args:
             self.error('Invalid endpoint')
 
-        func = args.__func__
+        func = args['__func__']
+        endpoint = tuple(parse_path(args.get('__endpoint__')))
+        timeout = args.get('__timeout__')
         args = self.clear_internal_keys(args)
-        args, kwargs = get_func_arguments(func, args)
-        return func(*args, **kwargs)
+        return self._call_func(func, args, call_plan=(call_plans or {}).get(id(func)), endpoint=endpoint,
+                               timeout=timeout, stats=stats, settings=settings)
+
+    def _call_func(self, func, args, call_plan=None, endpoint=None, timeout=None, stats=None, settings=None):
+        """
+        :param callable func:
+        :param dict args: Parsed arguments without internal keys
+        :param tuple|None call_plan: Result of `get_call_plan` for `func`
+        :param tuple|None endpoint: Endpoint path, reported in `CallStats`
+        :param float|None timeout: Endpoint timeout. `call_timeout` of root parser by default
+        :param list|None stats: `CallStats` of call is appended to it
+        :param settings: Object with `call_timeout` and `metrics_callback` fields. Root parser by default
+        """
+        call_plan = call_plan or self._get_call_plan(func)
+        with contextlib.ExitStack() as stack:
+            try:
+                args = map_file_arguments(func, args, stack, call_plan=call_plan)
+            except (OSError, ValueError) as e:
+                self.error(str(e))
+            args, kwargs = get_func_arguments(func, args, call_plan=call_plan)
+            try:
+                return self._run_func(func, args, kwargs, endpoint, timeout, stats, stack, settings)
+            finally:
+                # Drop references to mapped buffers, so mappings can be closed
+                args = kwargs = None
+
+    def _run_func(self, func, args, kwargs, endpoint, timeout, stats, stack=None, settings=None):
+        settings = settings or self.root or self
+        if timeout is None:
+            timeout = settings.call_timeout
+        is_coroutine = inspect.iscoroutinefunction(func)
+
+        def call():
+            if is_coroutine:
+                # Coroutine is created in the thread that runs it, so it is never left not awaited
+                return _run_coroutine(func(*args, **kwargs), timeout)
+            return func(*args, **kwargs)
+
+        if is_coroutine:
+            # Nested event loop can not be run in the thread of a running one, so worker thread is used then.
+            # Timeout of coroutine is handled by its own loop.
+            call_in_thread, thread_timeout = _is_loop_running(), None
+        else:
+            call_in_thread, thread_timeout = timeout is not None, timeout
+        if timeout is None and stats is None and settings.metrics_callback is None:
+            return _run_in_thread(call, thread_timeout, stack) if call_in_thread else call()
+
+        cpu_times = []
+        thread_time = getattr(time, 'thread_time', time.process_time)
+
+        def run():
+            start = thread_time()
+            try:
+                return call()
+            finally:
+                cpu_times.append(thread_time() - start)
+
+        timed_out = False
+        wall_start = time.perf_counter()
+        max_rss = _get_max_rss()
+        try:
+            if call_in_thread:
+                return _run_in_thread(run, thread_timeout, stack)
+            return run()
+        except EndpointTimeout:
+            timed_out = True
+            raise
+        finally:
+            call_stats = CallStats(
+                endpoint=endpoint,
+                wall_time=time.perf_counter() - wall_start,
+                cpu_time=cpu_times[0] if cpu_times else None,
+                max_rss_delta=_get_max_rss() - max_rss if max_rss is not None else None,
+                timed_out=timed_out,
+                abandoned_threads=_abandoned_threads,
+            )
+            if stats is not None:
+                stats.append(call_stats)
+            if settings.metrics_callback is not None:
+                try:
+                    settings.metrics_callback(call_stats)
+                except Exception as e:
+                    # Failed metrics must not replace result or exception of endpoint
+                    warnings.warn('metrics_callback failed: %r' % e, RuntimeWarning)
+
+    def _get_call_plan(self, func):
+        """
+        Return call plan of `func`, cached at the root parser.
+
+        :rtype: tuple
+        """
+        root = self.root or self
+        if root._call_plans is None:
+            root._call_plans = dict()
+        # Func is stored along with its plan, so its id can not be reused while cached
+        cached_func, call_plan = root._call_plans.get(id(func), (None, None))
+        if cached_func is not func:
+            call_plan = get_call_plan(func)
+            root._call_plans[id(func)] = (func, call_plan)
+        return call_plan
+
+    def freeze(self):
+        """
+        Freeze the whole parsers tree in place and return its immutable view, safe to be used from many threads.
+        Freezing is permanent: after it, this parser and all its subparsers can not be extended,
+        reconfigured or reloaded anymore. Build a new parser if the tree has to be changed.
+
+        :rtype: FrozenEndpointParser
+        """
+        root = self.root or self
+        if root._suggestion_index is None and root.endpoints:
+            root._suggestion_index = _build_suggestion_index(root.endpoints)
+        root._frozen = True
+        return FrozenEndpointParser(root)
+
+    @property
+    def frozen(self):
+        """
+        Whether parsers tree was frozen with `freeze`. Read-only.
+
+        :rtype: bool
+        """
+        return (self.root or self)._frozen
+
+    def _check_frozen(self):
+        if self.frozen:
+            raise RuntimeError('Parser is frozen')
+
+    def add_argument(self, *args, **kwargs):
+        self._check_frozen()
+        return super(EndpointParser, self).add_argument(*args, **kwargs)
+
+    def add_argument_group(self, *args, **kwargs):
+        self._check_frozen()
+        group = _EndpointArgumentGroup(self, *args, **kwargs)
+        self._action_groups.append(group)
+        return group
+
+    def add_mutually_exclusive_group(self, **kwargs):
+        self._check_frozen()
+        return super(EndpointParser, self).add_mutually_exclusive_group(**kwargs)
+
+    def _add_action(self, action):
+        self._check_frozen()
+        return super(EndpointParser, self)._add_action(action)
+
+    def set_defaults(self, **kwargs):
+        self._check_frozen()
+        super(EndpointParser, self).set_defaults(**kwargs)
+
+
+# noinspection PyProtectedMember
+class _EndpointArgumentGroup(argparse._ArgumentGroup):
+    """
+    Argument group that can not be extended after its parser is frozen.
+    """
+
+    def __init__(self, container, *args, **kwargs):
+        super(_EndpointArgumentGroup, self).__init__(container, *args, **kwargs)
+        self.container = container
+
+    def add_mutually_exclusive_group(self, **kwargs):
+        self.container._check_frozen()
+        return super(_EndpointArgumentGroup, self).add_mutually_exclusive_group(**kwargs)
+
+    def _add_action(self, action):
+        self.container._check_frozen()
+        return super(_EndpointArgumentGroup, self)._add_action(action)
+
+
+# noinspection PyProtectedMember
+class _EndpointSubParsersAction(argparse._SubParsersAction):
+    """
+    Subparsers action of `EndpointParser`. Added parsers are linked to the root parser.
+    """
+    container = None
+
+    def add_parser(self, name, **kwargs):
+        self.container._check_frozen()
+        parser = super(_EndpointSubParsersAction, self).add_parser(name, **kwargs)
+        parser.root = self.container.root or self.container
+        parser.path = list(self.container.path or []) + [name]
+        return parser
+
+
+class FrozenEndpointParser(object):
+    """
+    Immutable view of frozen `EndpointParser` tree. Created by `EndpointParser.freeze`.
+    Call plans of all endpoints are computed once, so dispatch does not inspect or modify anything.
+    `pipeline_separator`, `call_timeout` and `metrics_callback` of root parser are copied at freezing.
+    """
+    __slots__ = ('parser', 'endpoints', 'call_plans', 'pipeline_separator', 'call_timeout', 'metrics_callback')
+
+    def __init__(self, parser):
+        """
+        :param EndpointParser parser: Frozen root parser
+        """
+        endpoints = dict(parser.endpoints or {})
+        # Keyed by id, because bound methods of unhashable objects are unhashable too
+        call_plans = {id(endpoint.func): get_call_plan(endpoint.func) for endpoint in endpoints.values()}
+        object.__setattr__(self, 'parser', parser)
+        object.__setattr__(self, 'endpoints', types.MappingProxyType(endpoints))
+        object.__setattr__(self, 'call_plans', types.MappingProxyType(call_plans))
+        for name in ('pipeline_separator', 'call_timeout', 'metrics_callback'):
+            object.__setattr__(self, name, getattr(parser, name))
+
+    def __setattr__(self, key, value):
+        raise AttributeError('FrozenEndpointParser is immutable')
+
+    def parse_args(self, args=None, namespace=None):
+        return self.parser.parse_args(args, namespace)
+
+    def parse_and_call(self, args=None, namespace=None):
+        """
+        Shortcut function to parse args and call. Pipelines are supported.
+        """
+        return self.parser._call_pipeline(args, namespace, self.call, settings=self)
+
+    def call_path(self, *args, **kwargs):
+        return self.parser._call_path(_get_call_path_arg(args), kwargs, call_plans=self.call_plans, settings=self)
+
+    def call_mapping(self, path, mapping):
+        if isinstance(mapping, (str, bytes)):
+            mapping = json.loads(mapping if isinstance(mapping, str) else mapping.decode())
+        return self.parser._call_path(path, mapping, call_plans=self.call_plans, settings=self)
+
+    def call(self, args):
+        """
+        :param argparse.Namespace|dict args: Parsed arguments. Not modified.
+        """
+        args = dict(vars(args) if isinstance(args, argparse.Namespace) else args)
+        return self.parser._call(args, call_plans=self.call_plans, settings=self)
@@ -11,7 +11,7 @@ try:
 except(IOError, ImportError):
     long_description = long_description
 
-VERSION = '1.4'
+VERSION = '2.0'
 
 setup(
     name='argparse-autogen',
@@ -25,8 +25,6 @@ setup(
         'Environment :: Console',
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
         'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Topic :: Software Development :: Libraries :: Python Modules',
@@ -0,0 +1,172 @@
+import asyncio
+import mmap
+import threading
+import time
+
+import pytest
+
+import argparse_autogen
+
+
+def sleep(seconds='0'):
+    time.sleep(float(seconds))
+    return 'slept'
+
+
+async def async_sleep(seconds='0'):
+    await asyncio.sleep(float(seconds))
+    return 'slept'
+
+
+def allocate(size='0'):
+    return len(bytearray(int(size)))
+
+
+@pytest.fixture
+def parser():
+    parser = argparse_autogen.EndpointParser()
+    parser.add_endpoint('sleep', sleep, timeout=0.1)
+    parser.add_endpoint('async_sleep', async_sleep, timeout=0.1)
+    parser.add_endpoint('allocate', allocate)
+    return parser
+
+
+def test_endpoint_timeout(parser):
+    assert parser.parse_and_call(['sleep']) == 'slept'
+
+    with pytest.raises(argparse_autogen.EndpointTimeout):
+        parser.parse_and_call(['sleep', '--seconds', '1'])
+
+
+def test_async_endpoint_timeout(parser):
+    assert parser.parse_and_call(['async_sleep']) == 'slept'
+
+    with pytest.raises(argparse_autogen.EndpointTimeout):
+        parser.parse_and_call(['async_sleep', '--seconds', '1'])
+
+
+def test_async_endpoint_without_timeout(parser):
+    parser.add_endpoint('async_sleep_long', async_sleep)
+    stats = []
+    parser.metrics_callback = stats.append
+
+    assert parser.call_path('async_sleep_long', seconds=0.05) == 'slept'
+    assert stats[0].wall_time >= 0.05
+
+    parser.metrics_callback = None
+    assert parser.call_path('async_sleep_long') == 'slept'
+
+
+def test_async_endpoint_in_running_loop(parser):
+    async def main():
+        result = parser.parse_and_call(['async_sleep'])
+        with pytest.raises(argparse_autogen.EndpointTimeout):
+            parser.call_path('async_sleep', seconds=1)
+        return result
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(main()) == 'slept'
+    finally:
+        loop.close()
+
+
+def test_global_timeout(parser):
+    parser.add_endpoint('sleep_long', sleep)
+    parser.call_timeout = 0.1
+
+    with pytest.raises(argparse_autogen.EndpointTimeout):
+        parser.call_path('sleep_long', seconds=1)
+
+
+def test_exception_in_thread(parser):
+    with pytest.raises(ValueError):
+        parser.parse_and_call(['sleep', '--seconds', 'abc'])
+
+
+def test_metrics_callback(parser):
+    stats = []
+    parser.metrics_callback = stats.append
+
+    parser.parse_and_call(['allocate', '--size', str(50 * 1024 * 1024)])
+    with pytest.raises(argparse_autogen.EndpointTimeout):
+        parser.parse_and_call(['sleep', '--seconds', '1'])
+
+    assert stats[0].endpoint == ('allocate',)
+    assert stats[0].wall_time >= stats[0].cpu_time >= 0
+    assert not stats[0].timed_out
+    assert stats[0].max_rss_delta is None or stats[0].max_rss_delta >= 0
+
+    assert stats[1].endpoint == ('sleep',)
+    assert stats[1].timed_out
+    assert stats[1].cpu_time is None
+    assert stats[1].wall_time >= 0.1
+
+
+def test_abandoned_threads(parser):
+    release = threading.Event()
+    stats = []
+    parser.metrics_callback = stats.append
+    parser.add_endpoint('wait', lambda: release.wait(2), timeout=0.05)
+
+    with pytest.raises(argparse_autogen.EndpointTimeout):
+        parser.parse_and_call(['wait'])
+    assert stats[0].abandoned_threads >= 1
+    assert argparse_autogen.get_abandoned_threads() >= 1
+
+    release.set()
+    deadline = time.time() + 2
+    while argparse_autogen.get_abandoned_threads() >= stats[0].abandoned_threads and time.time() < deadline:
+        time.sleep(0.01)
+    assert argparse_autogen.get_abandoned_threads() < stats[0].abandoned_threads
+
+
+def test_failing_metrics_callback(parser):
+    def callback(call_stats):
+        raise KeyError(call_stats.endpoint)
+
+    parser.metrics_callback = callback
+
+    with pytest.warns(RuntimeWarning):
+        assert parser.parse_and_call(['allocate']) == 0
+    with pytest.warns(RuntimeWarning), pytest.raises(argparse_autogen.EndpointTimeout):
+        parser.parse_and_call(['sleep', '--seconds', '1'])
+
+
+def test_invoke_stats(parser):
+    result = parser.invoke(['sleep', '--seconds', '1'])
+
+    assert isinstance(result.exception, argparse_autogen.EndpointTimeout)
+    assert len(result.stats) == 1 and result.stats[0].timed_out
+
+    result = parser.invoke(['allocate'])
+
+    assert result.return_value == 0
+    assert result.stats[0].endpoint == ('allocate',)
+
+
+def test_timeout_with_mapped_file(parser, tmpdir):
+    path = tmpdir.join('data.bin')
+    path.write_binary(b'hello, world')
+    finished = threading.Event()
+    mapped = []
+
+    def hold(data: mmap.mmap):
+        mapped.append(data)
+        head = memoryview(data)[:5]
+        time.sleep(0.3)
+        result = bytes(head)
+        finished.set()
+        return result
+
+    parser.add_endpoint('hold', hold, timeout=0.1)
+
+    with pytest.raises(argparse_autogen.EndpointTimeout):
+        parser.parse_and_call(['hold', str(path)])
+    assert not mapped[0].closed
+
+    assert finished.wait(2)
+    deadline = time.time() + 2
+    while not mapped[0].closed and time.time() < deadline:
+        time.sleep(0.01)
+    assert mapped[0].closed
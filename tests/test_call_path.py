@@ -0,0 +1,104 @@
+import pytest
+
+import argparse_autogen
+
+
+class Users:
+    def get(self, user_id, verbose=False, fields='name'):
+        return user_id, verbose, fields
+
+    def set_roles(self, user_id, *role):
+        return user_id, role
+
+    def update(self, user_id, **fields):
+        return user_id, fields
+
+
+@pytest.fixture
+def parser():
+    parser = argparse_autogen.EndpointParser()
+    users = Users()
+    parser.add_endpoint('users get', users.get, argument_overrides={
+        'user_id': {'type': int},
+        '--fields': {'choices': ['name', 'email']},
+    })
+    parser.add_endpoint('users set_roles', users.set_roles)
+    parser.add_endpoint('users update', users.update)
+    return parser
+
+
+def test_same_result_as_parse_and_call(parser):
+    assert parser.call_path('users get', user_id=5) == parser.parse_and_call(['users', 'get', '5'])
+    assert parser.call_path('users.get', user_id='5', verbose=True, fields='email') == \
+        parser.parse_and_call(['users', 'get', '5', '--verbose', '--fields', 'email'])
+    assert parser.call_path(['users', 'set_roles'], user_id='1', role=['admin', 'dev']) == \
+        parser.parse_and_call(['users', 'set_roles', '1', 'admin', 'dev'])
+
+
+def test_var_keyword(parser):
+    assert parser.call_path('users update', user_id='1', name='bob', age=3) == ('1', {'name': 'bob', 'age': 3})
+    assert parser.call_path('users update', user_id='1') == ('1', {})
+
+
+def test_call_mapping(parser):
+    assert parser.call_mapping('users get', {'user_id': 5}) == (5, False, 'name')
+    assert parser.call_mapping('users get', '{"user_id": 5, "verbose": true}') == (5, True, 'name')
+    assert parser.call_mapping('users get', b'{"user_id": "7"}') == (7, False, 'name')
+
+
+@pytest.mark.parametrize(['path', 'kwargs', 'error'], [
+    ['users get', {}, 'the following arguments are required: user_id'],
+    ['users get', {'user_id': 'abc'}, "invalid int value: 'abc'"],
+    ['users get', {'user_id': 1, 'fields': 'phone'}, 'invalid choice'],
+    ['users get', {'user_id': 1, 'unknown': 1}, 'unrecognized arguments: unknown'],
+    ['users delete', {}, 'Invalid endpoint: users delete'],
+])
+def test_errors(parser, capsys, path, kwargs, error):
+    with pytest.raises(SystemExit):
+        parser.call_path(path, **kwargs)
+
+    assert error in capsys.readouterr().err
+
+
+def test_frozen(parser):
+    frozen = parser.freeze()
+
+    assert frozen.call_path('users get', user_id='5') == (5, False, 'name')
+    assert frozen.call_mapping('users get', '{"user_id": 5}') == (5, False, 'name')
+
+
+def test_param_named_path(parser):
+    def read(path, self_check=False):
+        return path, self_check
+
+    parser.add_endpoint('read', read)
+
+    assert parser.call_path('read', path='file.txt') == ('file.txt', False)
+    assert parser.freeze().call_path('read', path='file.txt', self_check=True) == ('file.txt', True)
+
+
+def test_path_is_required(parser):
+    with pytest.raises(TypeError):
+        parser.call_path(user_id=1)
+
+
+def test_scalar_var_positional(parser):
+    assert parser.call_path('users set_roles', user_id='1', role='admin') == \
+        parser.parse_and_call(['users', 'set_roles', '1', 'admin'])
+
+
+def test_empty_var_positional(parser):
+    with pytest.raises(SystemExit):
+        parser.parse_and_call(['users', 'set_roles', '1'])
+    with pytest.raises(SystemExit):
+        parser.call_path('users set_roles', user_id='1', role=[])
+
+
+@pytest.mark.parametrize(['value', 'expected'], [
+    ['false', False],
+    ['true', True],
+    [False, False],
+    [True, True],
+])
+def test_flag_string(parser, value, expected):
+    assert parser.call_path('users get', user_id=1, verbose=value) == (1, expected, 'name')
@@ -0,0 +1,144 @@
+import json
+import os
+
+import pytest
+
+import argparse_autogen
+
+
+def get(user_id, verbose=False, fields='name', limit=10):
+    return user_id, verbose, fields, limit
+
+
+@pytest.fixture
+def parser():
+    parser = argparse_autogen.EndpointParser()
+    parser.add_endpoint('users get', get, argument_overrides={'--limit': {'type': int}})
+    return parser
+
+
+@pytest.fixture
+def config_file(tmpdir):
+    path = tmpdir.join('config.json')
+    path.write(json.dumps({'users': {'get': {'fields': 'email', 'limit': '20'}}}))
+    return str(path)
+
+
+@pytest.fixture
+def env(monkeypatch):
+    monkeypatch.setenv('MYCLI_USERS_GET_LIMIT', '30')
+    monkeypatch.setenv('MYCLI_USERS_GET_VERBOSE', 'true')
+
+
+def test_compile_config():
+    compiled = argparse_autogen._compile_config({'users': {'get': {'limit': 1}}, 'users.list': {'all': True},
+                                                 'verbose': False})
+    assert compiled == {('users', 'get'): {'limit': 1}, ('users', 'list'): {'all': True}, (): {'verbose': False}}
+
+
+def test_load_config_cached(config_file):
+    compiled = argparse_autogen.load_config(config_file)
+
+    assert argparse_autogen.load_config(config_file) is compiled
+
+    with open(config_file, 'w') as f:
+        json.dump({'users.get': {'limit': 5}}, f)
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert argparse_autogen.load_config(config_file) == {('users', 'get'): {'limit': 5}}
+
+
+def test_load_config_missing(tmpdir):
+    assert argparse_autogen.load_config(str(tmpdir.join('missing.json'))) == {}
+
+
+def test_load_toml_config(tmpdir):
+    pytest.importorskip('tomllib')
+    path = tmpdir.join('config.toml')
+    path.write('[users.get]\nlimit = 5\n')
+
+    assert argparse_autogen.load_config(str(path)) == {('users', 'get'): {'limit': 5}}
+
+
+def test_unsupported_config(tmpdir):
+    path = tmpdir.join('config.ini')
+    path.write('')
+
+    with pytest.raises(ValueError):
+        argparse_autogen.load_config(str(path))
+
+
+def test_no_configured_defaults(parser):
+    assert parser.parse_and_call(['users', 'get', '1']) == ('1', False, 'name', 10)
+
+
+def test_config_file(parser, config_file):
+    parser.configure_defaults(config_files=config_file)
+
+    assert parser.parse_and_call(['users', 'get', '1']) == ('1', False, 'email', 20)
+    assert parser.call_path('users get', user_id='1') == ('1', False, 'email', 20)
+
+
+def test_env_over_config_file(parser, config_file, env):
+    parser.configure_defaults(config_files=[config_file], env_prefix='MYCLI_')
+
+    assert parser.parse_and_call(['users', 'get', '1']) == ('1', True, 'email', 30)
+    assert parser.call_path('users get', user_id='1') == ('1', True, 'email', 30)
+
+
+def test_command_line_over_env(parser, config_file, env):
+    parser.configure_defaults(config_files=[config_file], env_prefix='MYCLI')
+
+    assert parser.parse_and_call(['users', 'get', '1', '--limit=40', '--fields', 'id']) == ('1', True, 'id', 40)
+    assert parser.parse_and_call(['users', 'get', '1', '--lim', '40']) == ('1', True, 'email', 40)
+    assert parser.call_path('users get', user_id='1', limit=40) == ('1', True, 'email', 40)
+
+
+def test_invalid_configured_value(parser, monkeypatch):
+    monkeypatch.setenv('MYCLI_USERS_GET_LIMIT', 'abc')
+    parser.configure_defaults(env_prefix='MYCLI')
+
+    with pytest.raises(SystemExit):
+        parser.parse_and_call(['users', 'get', '1'])
+
+
+def test_command_line_short_option(parser, config_file):
+    parser.get_endpoint_parser('users get').add_argument('-l', dest='limit', type=int)
+    parser.configure_defaults(config_files=config_file)
+
+    assert parser.parse_and_call(['users', 'get', '1', '-l7']) == ('1', False, 'email', 7)
+
+
+def test_root_option_with_same_dest(parser, config_file):
+    parser.add_argument('--limit', type=int, default=100)
+    parser.configure_defaults(config_files=config_file)
+
+    assert parser.parse_and_call(['users', 'get', '1']) == ('1', False, 'email', 20)
+
+
+def test_many_values_from_env(monkeypatch):
+    def tag(*names, sizes=(), colors=()):
+        return names, sizes, colors
+
+    parser = argparse_autogen.EndpointParser()
+    parser.add_endpoint('tag', tag, argument_overrides={'--sizes': {'nargs': '*', 'type': int},
+                                                        '--colors': {'nargs': '+'}})
+    monkeypatch.setenv('MYCLI_TAG_SIZES', '1 2  3')
+    monkeypatch.setenv('MYCLI_TAG_COLORS', "red 'light blue'")
+    parser.configure_defaults(env_prefix='MYCLI')
+
+    assert parser.parse_and_call(['tag', 'a']) == (('a',), [1, 2, 3], ['red', 'light blue'])
+    assert parser.call_path('tag', names=['a']) == (('a',), [1, 2, 3], ['red', 'light blue'])
+
+
+def test_configured_value_not_in_choices(monkeypatch):
+    parser = argparse_autogen.EndpointParser()
+    parser.add_endpoint('users get', get, argument_overrides={'--fields': {'choices': ['name', 'email']}})
+    monkeypatch.setenv('MYCLI_USERS_GET_FIELDS', 'password')
+    parser.configure_defaults(env_prefix='MYCLI')
+
+    with pytest.raises(SystemExit):
+        parser.parse_and_call(['users', 'get', '1'])
+    with pytest.raises(SystemExit):
+        parser.call_path('users get', user_id='1')
@@ -0,0 +1,122 @@
+import threading
+
+import pytest
+
+import argparse_autogen
+
+
+class Cli:
+    __hash__ = None
+
+    def add(self, a, b, scale='1'):
+        return (int(a) + int(b)) * int(scale)
+
+
+@pytest.fixture
+def parser():
+    parser = argparse_autogen.EndpointParser()
+    parser.add_endpoint('math.add', Cli().add)
+    return parser
+
+
+def test_frozen_call(parser):
+    frozen = parser.freeze()
+
+    assert frozen.parse_and_call(['math', 'add', '1', '2', '--scale', '2']) == 6
+    assert ('math', 'add') in frozen.endpoints
+
+
+def test_call_does_not_modify_args(parser):
+    frozen = parser.freeze()
+    args = frozen.parse_args(['math', 'add', '1', '2'])
+
+    assert frozen.call(args) == 3
+    assert hasattr(args, '__func__')
+
+
+def test_invalid_endpoint(parser):
+    frozen = parser.freeze()
+
+    with pytest.raises(SystemExit):
+        frozen.parse_and_call(['math'])
+
+
+def test_modifications_forbidden(parser):
+    frozen = parser.freeze()
+
+    with pytest.raises(RuntimeError):
+        parser.add_endpoint('math.sub', lambda a, b: None)
+    with pytest.raises(RuntimeError):
+        parser.get_endpoint_parser('math.add').set_defaults(scale='3')
+    with pytest.raises(RuntimeError):
+        parser.get_endpoint_parser('math.add').add_argument('--verbose')
+    with pytest.raises(RuntimeError):
+        parser.reload_endpoints()
+    with pytest.raises(RuntimeError):
+        parser.get_endpoint_parser('math.add').add_argument_group('extra')
+    with pytest.raises(RuntimeError):
+        parser.get_endpoint_parser('math.add')._optionals.add_argument('--verbose')
+    with pytest.raises(RuntimeError):
+        parser.get_endpoint_parser('math.add').add_mutually_exclusive_group()
+    with pytest.raises(RuntimeError):
+        parser.get_endpoint_parser('math').subparsers.add_parser('sub')
+    with pytest.raises(AttributeError):
+        frozen.parser = None
+    with pytest.raises(AttributeError):
+        parser.frozen = False
+    with pytest.raises(TypeError):
+        frozen.endpoints[('math', 'sub')] = None
+
+    assert parser.get_endpoint_parser('math.add') is frozen.endpoints[('math', 'add')].parser
+    assert parser.frozen and parser.get_endpoint_parser('math').frozen
+
+
+def test_group_of_parser_frozen(parser):
+    group = parser.get_endpoint_parser('math.add').add_argument_group('extra')
+    group.add_argument('--verbose', action='store_true')
+    exclusive = group.add_mutually_exclusive_group()
+    parser.freeze()
+
+    with pytest.raises(RuntimeError):
+        group.add_argument('--quiet')
+    with pytest.raises(RuntimeError):
+        exclusive.add_argument('--quiet')
+
+
+def test_subparsers_add_parser(parser):
+    sub = parser.get_endpoint_parser('math').subparsers.add_parser('sub')
+
+    assert sub.root is parser
+    assert sub.path == ['math', 'sub']
+
+
+def test_dispatch_settings_copied(parser):
+    stats = []
+    parser.pipeline_separator = '--then'
+    parser.metrics_callback = stats.append
+    parser.call_timeout = 5
+    parser.add_endpoint('math.double', lambda value: value * 2, pipe_argument='value')
+    frozen = parser.freeze()
+    parser.pipeline_separator = parser.metrics_callback = parser.call_timeout = None
+
+    assert frozen.parse_and_call(['math', 'add', '1', '2', '--then', 'math', 'double']) == 6
+    assert [call_stats.endpoint for call_stats in stats] == [('math', 'add'), ('math', 'double')]
+    assert frozen.call_timeout == 5
+    with pytest.raises(AttributeError):
+        frozen.call_timeout = None
+
+
+def test_concurrent_calls(parser):
+    frozen = parser.freeze()
+    results = []
+
+    def worker(i):
+        results.append(frozen.parse_and_call(['math', 'add', str(i), str(i)]) == i * 2)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 20 and all(results)
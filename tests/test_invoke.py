@@ -0,0 +1,110 @@
+import sys
+import threading
+
+import pytest
+
+import argparse_autogen
+
+
+@pytest.fixture
+def parser():
+    parser = argparse_autogen.EndpointParser(prog='cli')
+
+    def echo(text, upper=False):
+        """
+        Print text.
+
+        :param str text: Text to print
+        """
+        print(text.upper() if upper else text)
+        return text
+
+    def fail():
+        raise ValueError('failed')
+
+    def cat():
+        return sys.stdin.read()
+
+    def stop(code):
+        sys.exit(code)
+
+    parser.add_endpoint('echo', echo)
+    parser.add_endpoint('fail', fail)
+    parser.add_endpoint('cat', cat)
+    parser.add_endpoint('stop', stop)
+    return parser
+
+
+def test_return_value_and_stdout(parser):
+    result = parser.invoke(['echo', '--upper', 'hello'])
+
+    assert result.exit_code == 0
+    assert result.return_value == 'hello'
+    assert result.stdout == 'HELLO\n'
+    assert result.exception is None
+
+
+def test_help(parser):
+    result = parser.invoke(['echo', '--help'])
+
+    assert result.exit_code == 0
+    assert 'Text to print' in result.stdout
+
+
+def test_parse_error(parser):
+    result = parser.invoke(['echo'])
+
+    assert result.exit_code == 2
+    assert 'the following arguments are required: text' in result.stderr
+    assert result.stdout == ''
+
+
+def test_exception(parser):
+    result = parser.invoke(['fail'])
+
+    assert result.exit_code == 1
+    assert isinstance(result.exception, ValueError)
+
+
+def test_stdin(parser):
+    assert parser.invoke(['cat'], stdin='data').return_value == 'data'
+    assert parser.invoke(['cat']).return_value == ''
+
+
+def test_sys_exit_message(parser):
+    result = parser.invoke(['stop', 'bye'])
+
+    assert result.exit_code == 1
+    assert result.stderr == 'bye\n'
+
+
+def test_streams_restored(parser):
+    stdout = sys.stdout
+    parser.invoke(['fail'])
+    assert sys.stdout is stdout
+
+
+def test_concurrent_invocations(parser):
+    stdout = sys.stdout
+    results = dict()
+
+    def worker(i):
+        results[i] = parser.invoke(['echo', 'text%s' % i])
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sys.stdout is stdout
+    assert all(results[i].stdout == 'text%s\n' % i for i in range(10))
+
+
+def test_output_of_timeout_thread_captured(parser):
+    def shout():
+        print('shout')
+
+    parser.add_endpoint('shout', shout, timeout=1)
+
+    assert parser.invoke(['shout']).stdout == 'shout\n'
@@ -0,0 +1,105 @@
+import mmap
+
+import pytest
+
+import argparse_autogen
+
+
+@pytest.fixture
+def parser():
+    return argparse_autogen.EndpointParser()
+
+
+@pytest.fixture
+def data_file(tmpdir):
+    path = tmpdir.join('data.bin')
+    path.write_binary(b'hello, world')
+    return str(path)
+
+
+def test_memoryview_argument(parser, data_file):
+    def checksum(data: memoryview):
+        return bytes(data[:5])
+
+    parser.add_endpoint('checksum', checksum)
+
+    assert parser.parse_and_call(['checksum', data_file]) == b'hello'
+
+
+def test_mmap_argument_closed_after_call(parser, data_file):
+    mapped = []
+
+    def read(data: mmap.mmap):
+        mapped.append(data)
+        return data[:]
+
+    parser.add_endpoint('read', read)
+
+    assert parser.parse_and_call(['read', data_file]) == b'hello, world'
+    assert mapped[0].closed
+
+
+def test_mapped_file_argument(parser, data_file):
+    def read(*data: argparse_autogen.MappedFile):
+        return [(f.name, len(f), f[7:]) for f in data]
+
+    parser.add_endpoint('read', read)
+
+    assert parser.parse_and_call(['read', data_file, data_file]) == [(data_file, 12, b'world')] * 2
+
+
+def test_empty_file(parser, tmpdir):
+    path = tmpdir.join('empty.bin')
+    path.write_binary(b'')
+
+    def read(data: memoryview):
+        return bytes(data)
+
+    parser.add_endpoint('read', read)
+    assert parser.parse_and_call(['read', str(path)]) == b''
+
+
+def test_missing_file(parser, tmpdir):
+    def read(data: memoryview):
+        pass
+
+    parser.add_endpoint('read', read)
+    with pytest.raises(SystemExit):
+        parser.parse_and_call(['read', str(tmpdir.join('missing.bin'))])
+
+
+def test_returned_buffer(parser, data_file):
+    def head(data: memoryview):
+        return data[:5]
+
+    def view(data: mmap.mmap):
+        return memoryview(data)[7:]
+
+    parser.add_endpoint('head', head)
+    parser.add_endpoint('view', view)
+
+    assert bytes(parser.parse_and_call(['head', data_file])) == b'hello'
+    assert bytes(parser.parse_and_call(['view', data_file])) == b'world'
+
+
+def test_generator_pipeline(parser, data_file):
+    def lines(data: memoryview):
+        return (data[i:i + 1] for i in range(0, len(data), 6))
+
+    def join(items=None):
+        return b''.join(bytes(item) for item in items)
+
+    parser.pipeline_separator = '--then'
+    parser.add_endpoint('lines', lines)
+    parser.add_endpoint('join', join, pipe_argument='items')
+
+    assert parser.parse_and_call(['lines', data_file, '--then', 'join']) == b'h '
+
+
+def test_string_annotation(parser, data_file):
+    def read(data: 'memoryview'):
+        return bytes(data)
+
+    parser.add_endpoint('read', read)
+
+    assert parser.parse_and_call(['read', data_file]) == b'hello, world'
@@ -0,0 +1,89 @@
+import types
+
+import pytest
+
+import argparse_autogen
+
+
+class Hosts:
+    def __init__(self):
+        self.drained = []
+
+    def list(self, count='3'):
+        return ('host%s' % i for i in range(int(count)))
+
+    def filter(self, hosts, prefix):
+        return (host for host in hosts or [] if host.startswith(prefix))
+
+    def drain(self, hosts=None):
+        self.drained.extend(hosts or [])
+        return len(self.drained)
+
+
+@pytest.fixture
+def hosts():
+    return Hosts()
+
+
+@pytest.fixture
+def parser(hosts):
+    parser = argparse_autogen.EndpointParser()
+    parser.pipeline_separator = '--then'
+    parser.add_endpoint('hosts list', hosts.list)
+    parser.add_endpoint('hosts filter', hosts.filter, pipe_argument='hosts')
+    parser.add_endpoint('hosts drain', hosts.drain, pipe_argument='hosts')
+    return parser
+
+
+def test_single_stage(parser):
+    assert isinstance(parser.parse_and_call(['hosts', 'list']), types.GeneratorType)
+
+
+def test_pipeline(parser, hosts):
+    result = parser.parse_and_call(['hosts', 'list', '--count', '12', '--then', 'hosts', 'filter', 'host1',
+                                    '--then', 'hosts', 'drain'])
+
+    assert result == 3
+    assert hosts.drained == ['host1', 'host10', 'host11']
+
+
+def test_pipe_argument_from_command_line(parser):
+    assert list(parser.parse_and_call(['hosts', 'filter', 'host'])) == []
+    assert parser.parse_and_call(['hosts', 'drain', '--hosts', 'a']) == 1
+
+
+def test_stage_without_pipe_argument(parser):
+    with pytest.raises(SystemExit):
+        parser.parse_and_call(['hosts', 'list', '--then', 'hosts', 'list'])
+
+
+def test_frozen_pipeline(parser, hosts):
+    frozen = parser.freeze()
+
+    assert frozen.parse_and_call(['hosts', 'list', '--then', 'hosts', 'drain']) == 3
+
+
+def test_var_positional_pipe_argument(parser):
+    def count(*items):
+        return len(items)
+
+    parser.add_endpoint('count', count, pipe_argument='items')
+
+    assert parser.parse_and_call(['hosts', 'list', '--then', 'count']) == 3
+    assert parser.parse_and_call(['count', 'a', 'b']) == 2
+
+
+def test_separator_after_double_dash(parser):
+    def echo(*text):
+        return text
+
+    parser.add_endpoint('echo', echo)
+
+    assert parser.parse_and_call(['echo', '--', '--then', 'x']) == ('--then', 'x')
+
+
+def test_pipelines_disabled_by_default():
+    parser = argparse_autogen.EndpointParser()
+    parser.add_endpoint('echo', lambda *text: text)
+
+    assert parser.parse_and_call(['echo', '--', 'a', '--then', 'b']) == ('a', '--then', 'b')
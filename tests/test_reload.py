@@ -0,0 +1,145 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+import argparse_autogen
+
+SOURCE = '''
+class Cli:
+    def greet(self, name):
+        return 'hello ' + name
+
+
+def version():
+    return 1
+'''
+
+CHANGED_SOURCE = '''
+class Cli:
+    def greet(self, name, punctuation='!'):
+        return 'hi ' + name + punctuation
+
+
+def version():
+    return 2
+'''
+
+
+@pytest.fixture
+def module(tmpdir):
+    tmpdir.join('reload_cli.py').write(SOURCE)
+    sys.path.insert(0, str(tmpdir))
+    importlib.invalidate_caches()
+    try:
+        yield importlib.import_module('reload_cli')
+    finally:
+        sys.path.remove(str(tmpdir))
+        sys.modules.pop('reload_cli', None)
+
+
+def change_module(module):
+    with open(module.__file__, 'w') as f:
+        f.write(CHANGED_SOURCE)
+    stat = os.stat(module.__file__)
+    os.utime(module.__file__, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def test_endpoints_registered(module):
+    parser = argparse_autogen.EndpointParser()
+    parser.add_endpoint('cli.version', module.version)
+
+    assert parser.endpoints[('cli', 'version')].func is module.version
+    assert parser.get_endpoint_parser('cli').endpoints is None
+    assert 'reload_cli' in parser.sources
+
+
+def test_nothing_changed(module):
+    parser = argparse_autogen.EndpointParser()
+    parser.add_endpoint('version', module.version)
+
+    assert parser.reload_endpoints() == []
+
+
+def test_reload_changed_module(module):
+    parser = argparse_autogen.EndpointParser()
+    cli = module.Cli()
+    parser.add_endpoint('greet', cli.greet)
+    parser.add_endpoint('version', module.version)
+
+    def unrelated():
+        return 'unrelated'
+
+    parser.add_endpoint('unrelated', unrelated)
+
+    assert parser.parse_and_call(['greet', 'bob']) == 'hello bob'
+
+    change_module(module)
+
+    assert sorted(parser.reload_endpoints()) == [('greet',), ('version',)]
+    assert parser.parse_and_call(['greet', 'bob', '--punctuation', '?']) == 'hi bob?'
+    assert parser.parse_and_call(['version']) == 2
+    assert parser.parse_and_call(['unrelated']) == 'unrelated'
+    assert parser.reload_endpoints() == []
+
+
+@pytest.fixture
+def modules(tmpdir):
+    tmpdir.join('reload_a.py').write('def a():\n    return 1\n')
+    tmpdir.join('reload_b.py').write('def b():\n    return 1\n')
+    sys.path.insert(0, str(tmpdir))
+    importlib.invalidate_caches()
+    try:
+        yield importlib.import_module('reload_a'), importlib.import_module('reload_b')
+    finally:
+        sys.path.remove(str(tmpdir))
+        sys.modules.pop('reload_a', None)
+        sys.modules.pop('reload_b', None)
+
+
+def write_module(module, source):
+    stat = os.stat(module.__file__)
+    with open(module.__file__, 'w') as f:
+        f.write(source)
+    os.utime(module.__file__, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def test_reload_failed_module(modules):
+    moda, modb = modules
+    parser = argparse_autogen.EndpointParser()
+    parser.add_endpoint('a', moda.a)
+    parser.add_endpoint('b', modb.b)
+
+    write_module(moda, 'def a():\n    return 2\n')
+    write_module(modb, 'def b(:\n')
+
+    with pytest.raises(argparse_autogen.ReloadError) as e:
+        parser.reload_endpoints()
+    assert e.value.paths == [('a',)]
+    assert list(e.value.errors) == ['reload_b']
+    assert isinstance(e.value.errors['reload_b'], SyntaxError)
+    assert parser.parse_and_call(['a']) == 2
+    assert parser.parse_and_call(['b']) == 1
+
+    write_module(modb, 'def b():\n    return 2\n')
+
+    assert parser.reload_endpoints() == [('b',)]
+    assert parser.parse_and_call(['a']) == 2
+    assert parser.parse_and_call(['b']) == 2
+
+
+def test_reload_unresolved_endpoint(module):
+    parser = argparse_autogen.EndpointParser()
+    parser.add_endpoint('version', module.version)
+
+    with open(module.__file__, 'w') as f:
+        f.write('def renamed():\n    return 2\n')
+    stat = os.stat(module.__file__)
+    os.utime(module.__file__, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    with pytest.raises(argparse_autogen.ReloadError) as e:
+        parser.reload_endpoints()
+    assert e.value.unresolved == [('version',)]
+    assert e.value.paths == []
+    assert parser.parse_and_call(['version']) == 1
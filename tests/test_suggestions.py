@@ -0,0 +1,82 @@
+import argparse
+
+import pytest
+
+import argparse_autogen
+
+
+@pytest.fixture
+def parser():
+    parser = argparse_autogen.EndpointParser(prog='cli')
+    for path in ['users get', 'users list', 'users set_roles', 'groups get', 'groups list', 'hosts drain']:
+        parser.add_endpoint(path, lambda: None)
+    return parser
+
+
+def test_levenshtein():
+    assert argparse_autogen._levenshtein('kitten', 'sitting') == 3
+    assert argparse_autogen._levenshtein('', 'abc') == 3
+    assert argparse_autogen._levenshtein('abc', 'abc') == 0
+
+
+def test_deletes_index():
+    index = argparse_autogen._DeletesIndex()
+    for word in ['book', 'books', 'cake', 'boo', 'cape', 'cart']:
+        index.add(word)
+
+    assert sorted(index.search('bok', 1)) == [(1, 'boo'), (1, 'book')]
+    assert sorted(index.search('bkoo', 2)) == [(1, 'boo'), (2, 'book')]
+    assert sorted(index.search('cark', 5)) == [(1, 'cart'), (2, 'cake'), (2, 'cape')]
+    assert argparse_autogen._DeletesIndex().search('bok', 1) == []
+
+
+def test_suggest_leaf(parser):
+    assert parser.suggest_endpoints('users gett') == [('users', 'get'), ('groups', 'get')]
+
+
+def test_suggest_full_paths(parser):
+    assert parser.suggest_endpoints('usrs') == [('users', 'get'), ('users', 'list'), ('users', 'set_roles')]
+    assert parser.suggest_endpoints(['usrs'], limit=1) == [('users', 'get')]
+
+
+def test_no_suggestions(parser):
+    assert parser.suggest_endpoints('completely different') == []
+    assert parser.suggest_endpoints('users get extra') == []
+    assert argparse_autogen.EndpointParser().suggest_endpoints('users') == []
+
+
+def test_index_invalidated(parser):
+    assert parser.suggest_endpoints('hosts fil') == []
+    parser.add_endpoint('hosts fill', lambda: None)
+    assert parser.suggest_endpoints('hosts fil') == [('hosts', 'fill')]
+
+
+def test_error_message(parser, capsys):
+    with pytest.raises(SystemExit):
+        parser.parse_args(['users', 'gett'])
+
+    assert 'Did you mean: users get, groups get?' in capsys.readouterr().err
+
+
+def test_error_message_no_suggestions(parser, capsys):
+    with pytest.raises(SystemExit):
+        parser.parse_args(['zzzzzzzz'])
+
+    assert 'Did you mean' not in capsys.readouterr().err
+
+
+def test_error_message_not_for_subparsers(parser, capsys):
+    parser.add_argument('--fmt', choices=['json', 'text'])
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(['--fmt', 'jsn', 'users', 'get'])
+
+    assert 'Did you mean' not in capsys.readouterr().err
+
+
+def test_suggestions_in_argument_error(parser):
+    with pytest.raises(argparse.ArgumentError) as e:
+        parser._check_value(parser.subparsers, 'usrs')
+
+    assert e.value.argument_name == argparse._get_action_name(parser.subparsers)
+    assert e.value.message.endswith('\nDid you mean: users get, users list, users set_roles?')